@@ -8,6 +8,7 @@ To use this, you will need to have the following environment variables set in th
 
 import asyncio
 import os
+import time
 
 from dotenv import load_dotenv
 
@@ -107,6 +108,26 @@ def upload_to_pinecone(chunked_docs, index_name: str, force_upload: bool = False
     return vector_store
 
 
+async def wait_for_index_data(index_name: str, expected_count: int, timeout: float = 30.0) -> None:
+    """Poll the index stats until the uploaded vectors are visible, or the timeout is reached"""
+    pc = Pinecone(api_key=PINECONE_API_KEY)
+    index = pc.Index(index_name)
+
+    # Start with a short delay and back off, as indexing usually finishes well within the timeout
+    deadline = time.monotonic() + timeout
+    delay = 0.5
+    while time.monotonic() < deadline:
+        try:
+            if index.describe_index_stats().get("total_vector_count", 0) >= expected_count:
+                return
+        except Exception as e:
+            print(f"Error checking index stats: {e}")
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 5.0)
+
+    print(f"Index {index_name} did not report {expected_count} vectors after {timeout:.0f} seconds, continuing anyway")
+
+
 def test_retrieval(index_name: str, query: str):
     """Test document retrieval from Pinecone"""
     vector_store = PineconeVectorStore(index_name=index_name, embedding=EMBEDDINGS)
@@ -134,6 +155,7 @@ async def main():
     Main function to process and upload documents asynchronously
     """
 
+    chunk_counts = {}
     for doc in bank_documents:
         index_name = doc["index_name"]
         path = doc["path"]
@@ -146,6 +168,7 @@ async def main():
         print(f"Chunking documents for {index_name}...")
         chunked_docs = chunk_documents(loaded_documents)
         print(f"Created {len(chunked_docs)} chunks")
+        chunk_counts[index_name] = len(chunked_docs)
 
         print(f"Setting up Pinecone for {index_name}...")
         setup_pinecone_index(index_name)
@@ -156,7 +179,8 @@ async def main():
 
     # Wait for Pinecone to index the data
     print("Waiting for Pinecone to index the data...")
-    await asyncio.sleep(30)
+    for index_name, chunk_count in chunk_counts.items():
+        await wait_for_index_data(index_name, expected_count=chunk_count)
 
     # Test retrieval for each index
     for doc in bank_documents:
@@ -12,7 +12,15 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-client = openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+@st.cache_resource
+def get_openai_client():
+    # Streamlit re-runs this script on every interaction, so cache the client
+    # to share it (and its HTTP connections) across reruns and sessions
+    return openai.OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+
+
+client = get_openai_client()
 
 
 class DestinationOverviewRequest(BaseModel):
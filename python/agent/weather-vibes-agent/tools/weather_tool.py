@@ -30,6 +30,9 @@ class WeatherTool(BaseTool):
             raise ValueError("WeatherAPI.com API key not found in environment")
         self.base_url = "http://api.weatherapi.com/v1/forecast.json"
 
+        # Reuse one session for every request so the connection to WeatherAPI.com is kept alive
+        self.session = requests.Session()
+
     async def execute(self, location: str, days: int = 1) -> Dict[str, Any]:
         """
         Execute the tool to get current weather and forecast.
@@ -50,7 +53,7 @@ class WeatherTool(BaseTool):
         }
 
         try:
-            response = requests.get(self.base_url, params=params)
+            response = self.session.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
 
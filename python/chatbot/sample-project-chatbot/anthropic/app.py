@@ -26,6 +26,7 @@ Set the following environment variable for your LLM:
 """
 
 from datetime import datetime
+from time import perf_counter_ns
 import os
 
 from anthropic import Anthropic
@@ -42,6 +43,11 @@ load_dotenv(override=True)
 # If this is not set, raise an exception
 MODEL_NAME = os.environ["MODEL_NAME"]
 
+# Create an Anthropic client once and reuse it for every message, so the underlying
+# HTTP connection is kept alive between calls instead of being set up each time.
+# This will use the environment variables set in the .env file
+client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
 # Start a new session named using the current date and time
 # This way every time you run the application, it will create a new session in Galileo
 # with the entire conversation inside the same session, with each message back and forth
@@ -82,12 +88,8 @@ def send_chat_to_anthropic() -> str:
     The response is logged manually to Galileo as an LLM span, including the number of
     input and output tokens, the model used, and the duration of the request in nanoseconds.
     """
-    # Create an Anthropic client
-    # This will use the environment variables set in the .env file
-    client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-
     # Capture the current time in nanoseconds for logging
-    start_time_ns = datetime.now().timestamp() * 1_000_000_000
+    start_time_ns = perf_counter_ns()
 
     # Convert the chat history to the format expected by Anthropic
     # This removes the system prompt to send separately as
@@ -122,7 +124,7 @@ def send_chat_to_anthropic() -> str:
         num_input_tokens=response.usage.input_tokens,
         num_output_tokens=response.usage.output_tokens,
         total_tokens=response.usage.input_tokens + response.usage.output_tokens,
-        duration_ns=(datetime.now().timestamp() * 1_000_000_000) - start_time_ns,
+        duration_ns=perf_counter_ns() - start_time_ns,
     )
 
     # Return the content of the response
@@ -27,6 +27,7 @@ Set the following environment variables for your LLM:
 """
 
 from datetime import datetime
+from time import perf_counter_ns
 import os
 
 from azure.ai.inference import ChatCompletionsClient
@@ -45,6 +46,15 @@ load_dotenv(override=True)
 # If this is not set, raise an exception
 MODEL_NAME = os.environ["MODEL_NAME"]
 
+# Create an Azure AI inference client once and reuse it for every message, so the
+# underlying HTTP connection is kept alive between calls instead of being set up each time.
+# This will use the environment variables set in the .env file
+client = ChatCompletionsClient(
+    endpoint=os.environ["AZURE_AI_INFERENCE_ENDPOINT"],
+    credential=AzureKeyCredential(os.environ["AZURE_AI_INFERENCE_API_KEY"]),
+    api_version="2024-05-01-preview",
+)
+
 # Start a new session named using the current date and time
 # This way every time you run the application, it will create a new session in Galileo
 # with the entire conversation inside the same session, with each message back and forth
@@ -85,16 +95,8 @@ def send_chat_to_azure() -> str:
     The response is logged manually to Galileo as an LLM span, including the number of
     input and output tokens, the model used, and the duration of the request in nanoseconds.
     """
-    # Create an Azure AI inference client
-    # This will use the environment variables set in the .env file
-    client = ChatCompletionsClient(
-        endpoint=os.environ["AZURE_AI_INFERENCE_ENDPOINT"],
-        credential=AzureKeyCredential(os.environ["AZURE_AI_INFERENCE_API_KEY"]),
-        api_version="2024-05-01-preview",
-    )
-
     # Capture the current time in nanoseconds for logging
-    start_time_ns = datetime.now().timestamp() * 1_000_000_000
+    start_time_ns = perf_counter_ns()
 
     # Convert the chat history to the format expected by Azure AI
     messages = []
@@ -123,7 +125,7 @@ def send_chat_to_azure() -> str:
         num_input_tokens=response.usage.prompt_tokens,
         num_output_tokens=response.usage.completion_tokens,
         total_tokens=response.usage.total_tokens,
-        duration_ns=(datetime.now().timestamp() * 1_000_000_000) - start_time_ns,
+        duration_ns=perf_counter_ns() - start_time_ns,
     )
 
     # Return the content of the response
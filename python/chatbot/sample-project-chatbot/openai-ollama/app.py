@@ -44,6 +44,12 @@ load_dotenv(override=True)
 # If this is not set, raise an exception
 MODEL_NAME = os.environ["MODEL_NAME"]
 
+# Create an OpenAI client once and reuse it for every message, so the underlying
+# HTTP connection is kept alive between calls instead of being set up each time.
+# This will use the environment variables set in the .env file, so can connect to
+# any OpenAI-compatible API, such as OpenAI or Ollama
+client = OpenAI()
+
 # Create a collection of messages with a system prompt
 # The default system prompt encourages the assistant to be helpful, but can lead to hallucinations.
 chat_history = [
@@ -79,11 +85,6 @@ def send_chat_to_openai() -> str:
     input and output tokens, the model used, and the duration of the request in nanoseconds.
     This is handled by the Galileo OpenAI client
     """
-    # Create an OpenAI client
-    # This will use the environment variables set in the .env file, so can connect to
-    # any OpenAI-compatible API, such as OpenAI or Ollama
-    client = OpenAI()
-
     # Send the prompt to the LLM and get a streaming response
     # This uses the Galileo OpenAI client which is configured to log the request and response
     # to Galileo automatically in an LLM span, along with token and other information.
@@ -81,6 +81,16 @@ embedding_fn = ef.OpenAIEmbeddingFunction(
 
 CHROMA_COLLECTION = "financial_docs"
 
+# The system message is the same for every request, so build it once.
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": (
+        "You are a knowledgeable financial services assistant. "
+        "Answer the user's question using ONLY the provided context. "
+        "If the context doesn't contain enough information, say so."
+    ),
+}
+
 
 # ---------------------------------------------------------------------------
 # LangGraph state & nodes
@@ -138,14 +148,7 @@ def generate_answer(state: GraphState) -> GraphState:
 
     context_block = "\n\n---\n\n".join(docs) if docs else "No additional context available."
     messages = [
-        {
-            "role": "system",
-            "content": (
-                "You are a knowledgeable financial services assistant. "
-                "Answer the user's question using ONLY the provided context. "
-                "If the context doesn't contain enough information, say so."
-            ),
-        },
+        SYSTEM_MESSAGE,
         {
             "role": "user",
             "content": f"Context:\n{context_block}\n\nQuestion: {question}",
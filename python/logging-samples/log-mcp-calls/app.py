@@ -9,6 +9,7 @@ import asyncio
 import os
 
 from datetime import datetime
+from time import perf_counter_ns
 
 from anthropic import Anthropic, omit
 from anthropic.types import Message
@@ -34,7 +35,7 @@ def call_llm(messages, use_tools: bool = True) -> Message:
     galileo_logger = galileo_context.get_logger_instance()
 
     # Capture the current time in nanoseconds for logging
-    start_time_ns = datetime.now().timestamp() * 1_000_000_000
+    start_time_ns = perf_counter_ns()
 
     # Call the LLM
     response = anthropic.messages.create(
@@ -53,7 +54,7 @@ def call_llm(messages, use_tools: bool = True) -> Message:
             num_input_tokens=response.usage.input_tokens,
             num_output_tokens=response.usage.output_tokens,
             total_tokens=response.usage.input_tokens + response.usage.output_tokens,
-            duration_ns=int((datetime.now().timestamp() * 1_000_000_000) - start_time_ns),
+            duration_ns=perf_counter_ns() - start_time_ns,
         )
 
     return response
@@ -62,7 +63,7 @@ def call_llm(messages, use_tools: bool = True) -> Message:
 async def process_query(query: str) -> str:
     """Process a query using Claude"""
     # Capture the current time in nanoseconds for logging
-    start_time_ns = datetime.now().timestamp() * 1_000_000_000
+    start_time_ns = perf_counter_ns()
 
     # Start a Galileo Logger trace
     galileo_logger = galileo_context.get_logger_instance()
@@ -86,7 +87,7 @@ async def process_query(query: str) -> str:
             final_text.append(content.text)
         elif content.type == "tool_use":
             # Get the tool start time
-            tool_start_time_ns = datetime.now().timestamp() * 1_000_000_000
+            tool_start_time_ns = perf_counter_ns()
 
             # Execute tool call
             result = await mcp_client.call_tool(content.name, content.input)
@@ -97,7 +98,7 @@ async def process_query(query: str) -> str:
                 output=result.content[0].text,
                 name=content.name,
                 tool_call_id=content.id,
-                duration_ns=int((datetime.now().timestamp() * 1_000_000_000) - tool_start_time_ns),
+                duration_ns=perf_counter_ns() - tool_start_time_ns,
             )
 
             final_text.append(f"[Calling tool {content.name}" + f"with args {content.input}]")
@@ -120,7 +121,7 @@ async def process_query(query: str) -> str:
     # Conclude and flush the trace
     galileo_logger.conclude(
         output="\n".join(final_text),
-        duration_ns=int((datetime.now().timestamp() * 1_000_000_000) - start_time_ns),
+        duration_ns=perf_counter_ns() - start_time_ns,
     )
     galileo_logger.flush()
 
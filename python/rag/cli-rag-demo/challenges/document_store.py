@@ -7,6 +7,9 @@ from typing import List, Dict, Optional, Union
 import re
 from pathlib import Path
 
+# Whitespace after a sentence-ending ., ! or ?, compiled once and reused for every document
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 class DocumentStore:
     def __init__(
@@ -164,7 +167,7 @@ class DocumentStore:
         Uses sentence boundaries where possible to maintain context.
         """
         # First split into sentences
-        sentences = re.split(r"(?<=[.!?])\s+", text)
+        sentences = SENTENCE_BOUNDARY.split(text)
 
         chunks = []
         current_chunk = []
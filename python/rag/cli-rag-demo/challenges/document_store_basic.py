@@ -5,6 +5,9 @@ from typing import List, Dict, Optional
 import re
 from pathlib import Path
 
+# Whitespace after a sentence-ending ., ! or ?, compiled once and reused for every document
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 class DocumentStoreBasic:
     def __init__(
@@ -54,7 +57,7 @@ class DocumentStoreBasic:
                 continue
 
             # Simple chunking - just split by sentences
-            sentences = re.split(r"(?<=[.!?])\s+", paragraph)
+            sentences = SENTENCE_BOUNDARY.split(paragraph)
             chunks = []
             current_chunk = []
             current_length = 0